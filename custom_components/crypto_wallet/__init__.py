@@ -3,6 +3,8 @@
 from homeassistant.const import Platform
 import logging
 
+from .const import DOMAIN
+
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
@@ -11,12 +13,14 @@ PLATFORMS = [Platform.SENSOR]
 async def async_setup_entry(hass, entry):
     """Set up Crypto Wallet from a config entry."""
     _LOGGER.debug(f"Setting up Crypto Wallet config entry: {entry.entry_id}")
-    for platform in PLATFORMS:
-        await hass.config_entries.async_forward_entry_setup(entry, platform)
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
 async def async_unload_entry(hass, entry) -> bool:
     """Unload Crypto Wallet config entry."""
     _LOGGER.debug(f"Unloading Crypto Wallet config entry: {entry.entry_id}")
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    return unload_ok
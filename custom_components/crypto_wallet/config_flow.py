@@ -7,17 +7,62 @@ from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
 from .const import (
     DOMAIN,
+    CONF_BULK_IMPORT,
     CONF_CRYPTO_API_ACCESS_TOKEN,
     CONF_BASE_CURRENCY,
     CONF_CRYPTO_TOKEN,
+    CONF_HOLDINGS,
     CONF_SCAN_INTERVAL,
     CONF_TOKEN_AMOUNTS,
 )
-from .helpers import fetch_available_crypto_tokens, Currency, CryptoWalletTotalSensor
+from .util import (
+    fetch_available_crypto_tokens,
+    parse_bulk_holdings,
+    Currency,
+)
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+BULK_IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOLDINGS): selector.TextSelector(
+            selector.TextSelectorConfig(multiline=True)
+        ),
+    }
+)
+
+
+def _import_holdings(config_data, raw, available_tokens):
+    """Merge pasted holdings into the config data.
+
+    Returns a tuple of the form errors and the description placeholders.
+    """
+    try:
+        holdings = parse_bulk_holdings(raw)
+    except ValueError as e:
+        _LOGGER.warning(f"Invalid bulk holdings: {e}")
+        return {"base": "invalid_holdings"}, {"details": str(e)}
+
+    if not holdings:
+        return {"base": "no_holdings"}, {"details": ""}
+
+    if available_tokens:
+        known_tokens = set(available_tokens)
+        unknown = [token for token in holdings if token not in known_tokens]
+        if unknown:
+            return {"base": "unknown_tokens"}, {"details": ", ".join(unknown[:20])}
+
+    tokens = dict.fromkeys(config_data.get(CONF_CRYPTO_TOKEN, []))
+    tokens.update(dict.fromkeys(holdings))
+    token_amounts = {**config_data.get(CONF_TOKEN_AMOUNTS, {}), **holdings}
+    config_data[CONF_CRYPTO_TOKEN] = list(tokens)
+    config_data[CONF_TOKEN_AMOUNTS] = {
+        token: token_amounts[token] for token in tokens if token in token_amounts
+    }
+    _LOGGER.debug(f"Imported {len(holdings)} holdings")
+    return {}, {}
+
 
 class CryptoWalletConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Crypto Wallet."""
@@ -28,6 +73,7 @@ class CryptoWalletConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         _LOGGER.debug("CryptoWalletConfigFlow: init")
         self.config_data = {}
         self.available_tokens = []
+        self.bulk_import = False
 
     @staticmethod
     @callback
@@ -41,7 +87,10 @@ class CryptoWalletConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.available_tokens = await fetch_available_crypto_tokens(self.hass)
 
         if user_input is not None:
+            self.bulk_import = user_input.pop(CONF_BULK_IMPORT, False)
             self.config_data.update(user_input)
+            if self.bulk_import:
+                return await self.async_step_bulk_import()
             return await self.async_step_token_amounts()
 
         data_schema = vol.Schema(
@@ -64,20 +113,49 @@ class CryptoWalletConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_SCAN_INTERVAL, default=300): vol.All(
                     vol.Coerce(int), vol.Range(min=60)
                 ),
+                vol.Optional(CONF_BULK_IMPORT, default=False): cv.boolean,
             }
         )
 
         return self.async_show_form(step_id="user", data_schema=data_schema)
 
+    async def async_step_bulk_import(self, user_input=None):
+        """Handle the step to paste holdings as CSV or JSON."""
+        _LOGGER.debug("async_step_user: Bulk import")
+        errors = {}
+        placeholders = {"details": ""}
+        if user_input is not None:
+            errors, placeholders = _import_holdings(
+                self.config_data, user_input[CONF_HOLDINGS], self.available_tokens
+            )
+            if not errors:
+                return await self.async_step_token_amounts()
+
+        return self.async_show_form(
+            step_id="bulk_import",
+            data_schema=BULK_IMPORT_SCHEMA,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
     async def async_step_token_amounts(self, user_input=None):
         """Handle the step to specify amounts for each token."""
         _LOGGER.debug("async_step_user: Token amount")
+        tokens = self.config_data.get(CONF_CRYPTO_TOKEN, [])
+        token_amounts = self.config_data.get(CONF_TOKEN_AMOUNTS, {})
+        if self.bulk_import:
+            # Only ask for the selected tokens that were not imported
+            tokens = [token for token in tokens if token not in token_amounts]
+            if user_input is None and not tokens:
+                user_input = {}
+
         if user_input is not None:
             # Store token amounts in the config_data
-            self.config_data.update({CONF_TOKEN_AMOUNTS: user_input})
+            self.config_data.update(
+                {CONF_TOKEN_AMOUNTS: {**token_amounts, **user_input}}
+            )
             return self.async_create_entry(title="Crypto Wallet", data=self.config_data)
 
-        tokens = self.config_data.get(CONF_CRYPTO_TOKEN, [])
         token_amounts_schema = {
             vol.Required(token): cv.positive_float for token in tokens
         }
@@ -108,6 +186,7 @@ class CryptoWalletOptionsFlowHandler(config_entries.OptionsFlow):
             config_entry.data
         )  # Initialize with existing config data
         self.available_tokens = []
+        self.bulk_import = False
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
@@ -121,7 +200,10 @@ class CryptoWalletOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             _LOGGER.debug(f"async_step_init: User input received: {user_input}")
+            self.bulk_import = user_input.pop(CONF_BULK_IMPORT, False)
             self.config_data.update(user_input)
+            if self.bulk_import:
+                return await self.async_step_bulk_import()
             return await self.async_step_token_amounts()
 
         tokens = self.config_data.get(CONF_CRYPTO_TOKEN, [])
@@ -155,20 +237,53 @@ class CryptoWalletOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
                     vol.Coerce(int), vol.Range(min=60)
                 ),
+                vol.Optional(CONF_BULK_IMPORT, default=False): cv.boolean,
             }
         )
 
         _LOGGER.debug("async_step_init: Showing form")
         return self.async_show_form(step_id="init", data_schema=options_schema)
 
+    async def async_step_bulk_import(self, user_input=None):
+        """Handle the step to paste holdings as CSV or JSON in options."""
+        _LOGGER.debug("async_step_bulk_import: Called")
+        errors = {}
+        placeholders = {"details": ""}
+        if user_input is not None:
+            errors, placeholders = _import_holdings(
+                self.config_data, user_input[CONF_HOLDINGS], self.available_tokens
+            )
+            if not errors:
+                return await self.async_step_token_amounts()
+
+        return self.async_show_form(
+            step_id="bulk_import",
+            data_schema=BULK_IMPORT_SCHEMA,
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
     async def async_step_token_amounts(self, user_input=None):
         """Handle the step to specify amounts for each token in options."""
         _LOGGER.debug(f"async_step_token_amounts: Called with user_input: {user_input}")
 
+        tokens = self.config_data.get(CONF_CRYPTO_TOKEN, [])
+        if self.bulk_import:
+            # The imported holdings already carry amounts, only ask for the
+            # remaining tokens
+            token_amounts = self.config_data.get(CONF_TOKEN_AMOUNTS, {})
+            tokens = [token for token in tokens if token not in token_amounts]
+            if user_input is None and not tokens:
+                user_input = {}
+        else:
+            token_amounts = self.config_entry.data.get(CONF_TOKEN_AMOUNTS, {})
+
         if user_input is not None:
             _LOGGER.debug(
                 f"async_step_token_amounts: Updating config data with: {user_input}"
             )
+            if self.bulk_import:
+                user_input = {**token_amounts, **user_input}
             self.config_data.update({CONF_TOKEN_AMOUNTS: user_input})
 
             # Update the config entry
@@ -177,14 +292,14 @@ class CryptoWalletOptionsFlowHandler(config_entries.OptionsFlow):
             )
 
             # Notify sensors of the configuration change
-            for entity in self.hass.data[DOMAIN].get(self.config_entry.entry_id, []):
-                if isinstance(entity, CryptoWalletTotalSensor):
-                    await entity.async_update()
+            total_sensor = self.hass.data.get(DOMAIN, {}).get(
+                self.config_entry.entry_id
+            )
+            if total_sensor is not None:
+                await total_sensor.async_update()
 
             return self.async_create_entry(title="Crypto Wallet", data=self.config_data)
 
-        tokens = self.config_data.get(CONF_CRYPTO_TOKEN, [])
-        token_amounts = self.config_entry.data.get(CONF_TOKEN_AMOUNTS, {})
         token_amounts_schema = {
             vol.Required(token, default=token_amounts.get(token, 0.0)): vol.All(
                 vol.Coerce(float), vol.Range(min=0)
@@ -7,3 +7,5 @@ CONF_CRYPTO_TOKEN = "crypto_token"
 CONF_BASE_CURRENCY = "base_currency"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_TOKEN_AMOUNTS = "token_amounts"
+CONF_BULK_IMPORT = "bulk_import"
+CONF_HOLDINGS = "holdings"
@@ -1,8 +1,7 @@
 import aiohttp
 import logging
-import locale
-from enum import Enum
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.helpers import entity_registry as er
 
 from homeassistant.util import Throttle
 
@@ -13,58 +12,10 @@ from .const import (
     CONF_TOKEN_AMOUNTS,
     DOMAIN,
 )
+from .util import Currency
 
 _LOGGER = logging.getLogger(__name__)
 
-# Initialize an empty list to store the available tokens
-available_tokens = []
-
-locale.setlocale(locale.LC_ALL, "")
-
-
-class Currency(Enum):
-    # TODO: get available currencies from coingecko API
-    #  see https://docs.coingecko.com/reference/simple-supported-currencies
-    usd = "$"
-    eur = "€"
-    gbp = "£"
-    jpy = "¥"
-    cny = "¥"
-
-    @classmethod
-    def get_currency_symbol(cls, currency_code: str) -> str:
-        try:
-            return cls[currency_code].value
-        except KeyError:
-            return currency_code
-
-    @classmethod
-    def get_all_currency_codes(cls) -> list:
-        return [currency.name for currency in cls]
-
-
-async def fetch_available_crypto_tokens(hass):
-    global available_tokens
-
-    # If the list is already populated, return it
-    if available_tokens:
-        _LOGGER.debug("Reuse available tokens from API")
-        return available_tokens
-    _LOGGER.debug("Fetching available tokens from API")
-
-    url = "https://api.coingecko.com/api/v3/coins/list"
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                coins = await response.json()
-                # Extract the IDs of the coins
-                available_tokens = [coin["id"] for coin in coins]
-                return available_tokens
-    except aiohttp.ClientError as e:
-        _LOGGER.error(f"Error fetching available crypto tokens: {e}")
-        return []
-
 
 class CryptoWalletTotalSensor(SensorEntity):
     """Representation of the total Crypto Wallet value sensor."""
@@ -120,6 +71,23 @@ class CryptoWalletTotalSensor(SensorEntity):
         """Return the unit of measurement."""
         return Currency.get_currency_symbol(self._unit_of_measurement)
 
+    async def async_added_to_hass(self):
+        """Schedule the first update without blocking the platform setup."""
+        # A background task does not hold up HA startup and is cancelled when
+        # the config entry is unloaded
+        self._config_entry.async_create_background_task(
+            self._hass,
+            self._async_first_update(),
+            name=f"{DOMAIN} first update {self._config_entry.entry_id}",
+        )
+
+    async def _async_first_update(self):
+        """Fetch the initial prices and write them to all token sensors."""
+        await self.async_update_ha_state(True)
+        for sensor in self._token_sensors.values():
+            if sensor.hass is not None:
+                sensor.async_write_ha_state()
+
     def update_config(self, entry):
         """Update the sensor with new configuration."""
         self._tokens = entry.data.get(CONF_CRYPTO_TOKEN, [])
@@ -173,6 +141,45 @@ class CryptoWalletTotalSensor(SensorEntity):
         _LOGGER.debug(f"Total wallet value: {total_value:.2f} {currency_symbol}")
         return total_value
 
+    def _reconcile_token_sensors(self, new_tokens, new_token_amounts, currency):
+        """Add, remove and update token sensors to match the configured tokens."""
+        wanted = dict.fromkeys(new_tokens)
+        removed = self._token_sensors.keys() - wanted
+        added = [token for token in wanted if token not in self._token_sensors]
+        _LOGGER.debug(
+            f"Reconciling token sensors: {len(added)} added, {len(removed)} removed"
+        )
+
+        # Update amounts of the tokens that are kept
+        for token, sensor in self._token_sensors.items():
+            if token in wanted:
+                amount = new_token_amounts.get(token, 1)
+                if sensor.amount != amount:
+                    sensor.amount = amount
+
+        # Remove tokens that are no longer selected, including their registry
+        # entries so that the entities do not linger as unavailable
+        if removed:
+            registry = er.async_get(self._hass)
+            for token in removed:
+                sensor = self._token_sensors.pop(token)
+                if sensor.entity_id and registry.async_get(sensor.entity_id):
+                    # Removing the registry entry also removes the entity itself
+                    registry.async_remove(sensor.entity_id)
+                elif sensor.hass is not None:
+                    self._hass.async_create_task(sensor.async_remove())
+
+        # Add new tokens in a single batch
+        if added:
+            new_sensors = []
+            for token in added:
+                new_sensor = CryptoWalletTokenSensor(
+                    token, new_token_amounts.get(token, 1), currency, self
+                )
+                self._token_sensors[token] = new_sensor
+                new_sensors.append(new_sensor)
+            self._async_add_entities(new_sensors)
+
     async def async_update(self):
         """Fetch the token prices and calculate the wallet value."""
         _LOGGER.debug("Updating the Crypto Wallet total value sensor.")
@@ -192,31 +199,7 @@ class CryptoWalletTotalSensor(SensorEntity):
             self._tokens = new_tokens
             self._token_amounts = new_token_amounts
 
-            # Update existing tokens' amounts
-            for token in self._token_sensors:
-                if token in new_tokens:
-                    self._token_sensors[token].amount = new_token_amounts.get(token, 1)
-
-            # Remove tokens that are no longer selected
-            for token in list(self._token_sensors.keys()):
-                if token not in new_tokens:
-                    # FIXME: this only removes the provision of data, but the entity history remains
-                    self._hass.async_create_task(
-                        self._token_sensors[token].async_remove()
-                    )
-                    del self._token_sensors[token]
-
-            # Add new tokens
-            new_sensors = []
-            for token in new_tokens:
-                if token not in self._token_sensors:
-                    new_sensor = CryptoWalletTokenSensor(
-                        token, new_token_amounts.get(token, 1), currency, self
-                    )
-                    self._token_sensors[token] = new_sensor
-                    new_sensors.append(new_sensor)
-            if new_sensors:
-                self._async_add_entities(new_sensors)
+            self._reconcile_token_sensors(new_tokens, new_token_amounts, currency)
 
         self._prices = await self.get_token_prices()
         if self._prices:
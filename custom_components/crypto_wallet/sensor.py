@@ -46,9 +46,11 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         token_sensors[token] = token_sensor
 
     all_sensors = [total_sensor] + list(token_sensors.values())
-    async_add_entities(all_sensors, True)
+    # The first price fetch is scheduled by the total sensor once it is added
+    async_add_entities(all_sensors)
 
-    # Register sensors in hass.data for later reference
+    # Register the total sensor in hass.data for later reference, it owns the
+    # token sensors and keeps them in sync with the configuration
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
-    hass.data[DOMAIN][config_entry.entry_id] = all_sensors
+    hass.data[DOMAIN][config_entry.entry_id] = total_sensor
@@ -0,0 +1,148 @@
+"""Helpers used by the config flow that do not depend on the sensor platform."""
+
+import csv
+import io
+import json
+import logging
+import math
+from enum import Enum
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Initialize an empty list to store the available tokens
+available_tokens = []
+
+
+class Currency(Enum):
+    # TODO: get available currencies from coingecko API
+    #  see https://docs.coingecko.com/reference/simple-supported-currencies
+    usd = "$"
+    eur = "€"
+    gbp = "£"
+    jpy = "¥"
+    cny = "¥"
+
+    @classmethod
+    def get_currency_symbol(cls, currency_code: str) -> str:
+        try:
+            return cls[currency_code].value
+        except KeyError:
+            return currency_code
+
+    @classmethod
+    def get_all_currency_codes(cls) -> list:
+        return [currency.name for currency in cls]
+
+
+async def fetch_available_crypto_tokens(hass):
+    global available_tokens
+
+    # If the list is already populated, return it
+    if available_tokens:
+        _LOGGER.debug("Reuse available tokens from API")
+        return available_tokens
+    _LOGGER.debug("Fetching available tokens from API")
+
+    url = "https://api.coingecko.com/api/v3/coins/list"
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                coins = await response.json()
+                # Extract the IDs of the coins
+                available_tokens = [coin["id"] for coin in coins]
+                return available_tokens
+    except aiohttp.ClientError as e:
+        _LOGGER.error(f"Error fetching available crypto tokens: {e}")
+        return []
+
+
+# Names accepted for the token column of a CSV header row
+HOLDINGS_HEADER_TOKENS = {"token", "tokens", "id", "coin", "coin_id", "asset", "name"}
+
+
+def _parse_holding_amount(token, amount):
+    """Convert a holding amount to a non-negative float or raise ValueError."""
+    try:
+        if isinstance(amount, bool):
+            raise TypeError
+        value = float(amount)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid amount for {token!r}: {amount!r}") from None
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(f"Invalid amount for {token!r}: {amount!r}")
+    return value
+
+
+def _is_holdings_header(row):
+    """Return True if a CSV row looks like a ``token,amount`` header."""
+    token, amount = row
+    if token.strip().lower() not in HOLDINGS_HEADER_TOKENS:
+        return False
+    try:
+        float(amount)
+    except ValueError:
+        return True
+    return False
+
+
+def parse_bulk_holdings(raw: str) -> dict:
+    """Parse pasted holdings into a mapping of token id to amount.
+
+    Accepts either JSON (an object ``{"bitcoin": 0.5}`` or a list of
+    ``{"token": ..., "amount": ...}`` objects / ``[token, amount]`` pairs) or CSV
+    lines of ``token,amount`` (``;`` and tab are accepted as delimiters, a header
+    row and ``#`` comments are skipped). Amounts of duplicated tokens are summed.
+    Raises ValueError if the input cannot be parsed.
+    """
+    raw = raw.strip()
+    if not raw:
+        return {}
+
+    if raw[0] in "{[":
+        data = json.loads(raw)
+        if isinstance(data, dict):
+            rows = list(data.items())
+        elif isinstance(data, list):
+            rows = []
+            for item in data:
+                if isinstance(item, dict):
+                    rows.append((item.get("token", item.get("id")), item.get("amount")))
+                elif isinstance(item, (list, tuple)) and len(item) == 2:
+                    rows.append(tuple(item))
+                else:
+                    raise ValueError(f"Invalid holdings row: {item!r}")
+        else:
+            raise ValueError("JSON holdings must be an object or a list")
+    else:
+        # Guess the delimiter from the first line that holds data
+        first_line = next(
+            (
+                line
+                for line in raw.splitlines()
+                if line.strip() and not line.lstrip().startswith("#")
+            ),
+            "",
+        )
+        delimiter = ";" if ";" in first_line else "\t" if "\t" in first_line else ","
+        rows = [
+            row
+            for row in csv.reader(io.StringIO(raw), delimiter=delimiter)
+            if "".join(row).strip() and not row[0].lstrip().startswith("#")
+        ]
+        for row in rows:
+            if len(row) != 2:
+                raise ValueError(f"Invalid holdings row: {row!r}")
+        if rows and _is_holdings_header(rows[0]):
+            rows = rows[1:]
+
+    holdings = {}
+    for token, amount in rows:
+        if not isinstance(token, str) or not token.strip():
+            raise ValueError(f"Invalid token: {token!r}")
+        token = token.strip().lower()
+        amount = _parse_holding_amount(token, amount)
+        holdings[token] = holdings.get(token, 0) + amount
+    return holdings
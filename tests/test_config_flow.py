@@ -0,0 +1,31 @@
+"""Tests for the Crypto Wallet config flow."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+CHECK_IMPORTS = """
+import sys
+
+import custom_components.crypto_wallet.config_flow
+
+for module in (
+    "custom_components.crypto_wallet.helpers",
+    "custom_components.crypto_wallet.sensor",
+    "homeassistant.components.sensor",
+):
+    assert module not in sys.modules, module
+"""
+
+
+def test_config_flow_does_not_import_sensor_platform():
+    """Loading the flow must not pull in the sensor platform."""
+    # Run in a fresh interpreter as other tests import the sensor modules
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_IMPORTS],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,111 @@
+"""Tests for the Crypto Wallet sensor helpers."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.crypto_wallet.helpers import (
+    CryptoWalletTokenSensor,
+    CryptoWalletTotalSensor,
+)
+
+
+@pytest.fixture
+def hass():
+    hass = MagicMock()
+    # Close scheduled coroutines so they are not reported as never awaited
+    hass.async_create_task.side_effect = lambda coro: coro.close()
+    return hass
+
+
+@pytest.fixture
+def registry():
+    registry = MagicMock()
+    with patch(
+        "custom_components.crypto_wallet.helpers.er.async_get", return_value=registry
+    ):
+        yield registry
+
+
+def _total_sensor(hass, token_amounts):
+    token_sensors = {}
+    total_sensor = CryptoWalletTotalSensor(
+        hass,
+        MagicMock(),
+        list(token_amounts),
+        dict(token_amounts),
+        "usd",
+        token_sensors,
+        timedelta(seconds=60),
+        MagicMock(),
+    )
+    for token, amount in token_amounts.items():
+        sensor = CryptoWalletTokenSensor(token, amount, "usd", total_sensor)
+        sensor.entity_id = f"sensor.crypto_wallet_{token}"
+        token_sensors[token] = sensor
+    return total_sensor
+
+
+def test_reconcile_adds_new_tokens_in_one_batch(hass, registry):
+    total_sensor = _total_sensor(hass, {"bitcoin": 1})
+
+    total_sensor._reconcile_token_sensors(
+        ["bitcoin", "ethereum", "solana"],
+        {"bitcoin": 1, "ethereum": 2, "solana": 3},
+        "usd",
+    )
+
+    total_sensor._async_add_entities.assert_called_once()
+    (new_sensors,) = total_sensor._async_add_entities.call_args.args
+    assert [sensor._token for sensor in new_sensors] == ["ethereum", "solana"]
+    assert [sensor.amount for sensor in new_sensors] == [2, 3]
+    assert list(total_sensor._token_sensors) == ["bitcoin", "ethereum", "solana"]
+    registry.async_remove.assert_not_called()
+
+
+def test_reconcile_removes_registry_entries(hass, registry):
+    total_sensor = _total_sensor(hass, {"bitcoin": 1, "ethereum": 2, "solana": 3})
+
+    total_sensor._reconcile_token_sensors(["bitcoin"], {"bitcoin": 1}, "usd")
+
+    assert list(total_sensor._token_sensors) == ["bitcoin"]
+    assert {call.args[0] for call in registry.async_remove.call_args_list} == {
+        "sensor.crypto_wallet_ethereum",
+        "sensor.crypto_wallet_solana",
+    }
+    total_sensor._async_add_entities.assert_not_called()
+    hass.async_create_task.assert_not_called()
+
+
+def test_reconcile_only_reassigns_changed_amounts(hass, registry):
+    total_sensor = _total_sensor(hass, {"bitcoin": 1, "ethereum": 2})
+
+    with patch.object(
+        CryptoWalletTokenSensor, "update_from_total_sensor", autospec=True
+    ) as update_from_total_sensor:
+        total_sensor._reconcile_token_sensors(
+            ["bitcoin", "ethereum"], {"bitcoin": 1, "ethereum": 5}, "usd"
+        )
+
+    updated = [call.args[0]._token for call in update_from_total_sensor.call_args_list]
+    assert updated == ["ethereum"]
+    assert total_sensor._token_sensors["bitcoin"].amount == 1
+    assert total_sensor._token_sensors["ethereum"].amount == 5
+    total_sensor._async_add_entities.assert_not_called()
+    registry.async_remove.assert_not_called()
+
+
+def test_reconcile_removes_unregistered_sensor(hass, registry):
+    total_sensor = _total_sensor(hass, {"bitcoin": 1, "ethereum": 2})
+    sensor = total_sensor._token_sensors["ethereum"]
+    sensor.hass = hass
+    sensor.async_remove = AsyncMock()
+    registry.async_get.return_value = None
+
+    total_sensor._reconcile_token_sensors(["bitcoin"], {"bitcoin": 1}, "usd")
+
+    assert list(total_sensor._token_sensors) == ["bitcoin"]
+    sensor.async_remove.assert_called_once_with()
+    hass.async_create_task.assert_called_once()
+    registry.async_remove.assert_not_called()
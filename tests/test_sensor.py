@@ -0,0 +1,39 @@
+"""Tests for the Crypto Wallet sensor platform."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.crypto_wallet.const import (
+    CONF_CRYPTO_TOKEN,
+    CONF_SCAN_INTERVAL,
+    CONF_TOKEN_AMOUNTS,
+    DOMAIN,
+)
+from custom_components.crypto_wallet.helpers import CryptoWalletTotalSensor
+from custom_components.crypto_wallet.sensor import async_setup_entry
+
+
+def test_setup_entry_does_not_fetch_prices():
+    """Platform setup must not wait for the CoinGecko API."""
+    hass = MagicMock()
+    hass.data = {}
+    config_entry = MagicMock()
+    config_entry.data = {
+        CONF_CRYPTO_TOKEN: ["bitcoin", "ethereum"],
+        CONF_TOKEN_AMOUNTS: {"bitcoin": 1, "ethereum": 2},
+        CONF_SCAN_INTERVAL: 300,
+    }
+    async_add_entities = MagicMock()
+
+    with patch.object(
+        CryptoWalletTotalSensor, "get_token_prices", new_callable=AsyncMock
+    ) as get_token_prices:
+        asyncio.run(async_setup_entry(hass, config_entry, async_add_entities))
+
+    get_token_prices.assert_not_called()
+    async_add_entities.assert_called_once()
+    sensors, *update_before_add = async_add_entities.call_args.args
+    assert len(sensors) == 3
+    assert not any(update_before_add)
+    assert not async_add_entities.call_args.kwargs.get("update_before_add")
+    assert isinstance(hass.data[DOMAIN][config_entry.entry_id], CryptoWalletTotalSensor)
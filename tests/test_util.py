@@ -0,0 +1,64 @@
+"""Tests for the Crypto Wallet utilities."""
+
+import pytest
+
+from custom_components.crypto_wallet.util import parse_bulk_holdings
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("", {}),
+        ("  \n ", {}),
+        ('{"bitcoin": 0.5, "Ethereum": 2}', {"bitcoin": 0.5, "ethereum": 2.0}),
+        (
+            '[{"token": "bitcoin", "amount": "0.5"}, {"id": "solana", "amount": 3}]',
+            {"bitcoin": 0.5, "solana": 3.0},
+        ),
+        ('[["bitcoin", 1], ["ethereum", "2.5"]]', {"bitcoin": 1.0, "ethereum": 2.5}),
+        ("bitcoin,0.5\nethereum,2", {"bitcoin": 0.5, "ethereum": 2.0}),
+        ("bitcoin;0.5\nethereum;2", {"bitcoin": 0.5, "ethereum": 2.0}),
+        ("bitcoin\t0.5\nethereum\t2", {"bitcoin": 0.5, "ethereum": 2.0}),
+        ("token,amount\nbitcoin,0.5", {"bitcoin": 0.5}),
+        ("Coin;Amount\nbitcoin;0.5", {"bitcoin": 0.5}),
+        ("# my wallet\nbitcoin,0.5\n\n # cold storage\nbitcoin,1", {"bitcoin": 1.5}),
+        (" Bitcoin , 0.5 ", {"bitcoin": 0.5}),
+        ("# export; cold wallet\nbitcoin,0.5", {"bitcoin": 0.5}),
+        (
+            "# export, cold wallet\nbitcoin;0.5\nsolana;1",
+            {"bitcoin": 0.5, "solana": 1.0},
+        ),
+        ("# only a comment", {}),
+        ("bitcoin,0", {"bitcoin": 0.0}),
+    ],
+)
+def test_parse_bulk_holdings(raw, expected):
+    assert parse_bulk_holdings(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "bitcoin;1,5",
+        "bitcoin,0.5abc",
+        "bitcoin,0.5\nethereum,x",
+        "token,amount\nbitcoin",
+        "bitcoin,1,2",
+        "bitcoin,-1",
+        "bitcoin,nan",
+        ",1",
+        '["12"]',
+        "[1]",
+        '[["bitcoin", 1, 2]]',
+        '{"bitcoin": true}',
+        '{"bitcoin": "abc"}',
+        '{"bitcoin": null}',
+        '[{"amount": 1}]',
+        "[[1, 2]]",
+        '"bitcoin"',
+        "{not json",
+    ],
+)
+def test_parse_bulk_holdings_invalid(raw):
+    with pytest.raises(ValueError):
+        parse_bulk_holdings(raw)